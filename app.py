@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import gzip
+import json
+import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice, repeat
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, make_response, render_template, request
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.http import generate_etag
 
 from vaults import (
     MORPHO_SITE_URL,
     compute_pnl_from_prices,
     fetch_curator_profile,
     fetch_share_price_usd_series,
+    fetch_vault_histories_batch,
     fetch_vault_history_timeseries,
     fetch_vaults_for_curator,
     fetch_vault_details,
@@ -21,11 +32,154 @@ from vaults import (
 )
 
 app = Flask(__name__)
+# Compiled templates are shared through the temp dir, so fresh workers skip the
+# parse. TEMPLATES_AUTO_RELOAD stays unset: it follows debug mode.
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 DEFAULT_RANGE_DAYS = 30
 CURATOR_VAULT_WINDOW_DAYS = 30
+# Every in-process cache below is an LRU bounded to CACHE_MAX_ENTRIES (or a
+# smaller dedicated bound for large payloads); expired entries are dropped when
+# they are next looked up.
+CACHE_MAX_ENTRIES = 4096
 CURATOR_VAULT_CACHE_TTL = 1800  # 30 minutes
-CURATOR_VAULT_CACHE: Dict[Tuple[str, int, int, int], Dict[str, Any]] = {}
+CURATOR_VAULT_CACHE: OrderedDict[Tuple[str, int, int], Dict[str, Any]] = OrderedDict()
+VAULT_DETAILS_CACHE_TTL = 60
+VAULT_DETAILS_CACHE: OrderedDict[Tuple[str, int], Dict[str, Any]] = OrderedDict()
+SHARE_PRICE_CACHE_TTL = 300  # 5 minutes
+# Full-history series can hold tens of thousands of points.
+SHARE_PRICE_CACHE_MAX_ENTRIES = 128
+SHARE_PRICE_CACHE: OrderedDict[
+    Tuple[str, int, Optional[int], Optional[int]], Dict[str, Any]
+] = OrderedDict()
+CURATOR_PROFILE_CACHE_TTL = 300  # 5 minutes
+CURATOR_PROFILE_CACHE: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+VAULT_WINDOW_CACHE_TTL = 300  # 5 minutes
+VAULT_WINDOW_CACHE: OrderedDict[
+    Tuple[str, int, Optional[int], Optional[int]], Dict[str, Any]
+] = OrderedDict()
+# Rendered pages keyed on the raw query string. The caches underneath stack:
+# vaults.run_graphql_query keeps responses for GRAPHQL_CACHE_TTL, the details
+# cache for VAULT_DETAILS_CACHE_TTL, and then this one, so a page can show
+# vault state up to the sum of the three (3 minutes) old.
+PAGE_CACHE_TTL = VAULT_DETAILS_CACHE_TTL
+# A page embeds its whole chart payload (hundreds of KB for a full history).
+PAGE_CACHE_MAX_ENTRIES = 64
+PAGE_CACHE: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+# The caches are filled concurrently by the request threads and the pool.
+_CACHE_LOCK = threading.Lock()
+_CACHE_MISS = object()
+# (id(cache), key) pairs with a background refresh in flight.
+_CACHE_REFRESHING: set = set()
+
+EXOTIC_STABLECOINS = frozenset({"XUSD", "DEUSD", "USD0", "USDE"})
+_EXOTIC_STABLECOINS_LABEL = ", ".join(sorted(EXOTIC_STABLECOINS))
+
+COMPRESS_MIN_SIZE = 1024  # bytes
+COMPRESS_LEVEL = 5
+COMPRESS_MIMETYPES = {"text/html", "application/json"}
+
+# Shared pool for the blocking Morpho API calls issued while rendering a page.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+def _cache_get(
+    cache: OrderedDict[Any, Dict[str, Any]],
+    key: Any,
+    refresh: Optional[Callable[[], Any]] = None,
+) -> Any:
+    """
+    Return the cached data for ``key``, or ``_CACHE_MISS``.
+
+    With ``refresh``, an entry past half of its TTL is still served, and
+    ``refresh()`` is scheduled on the pool to recompute it in the background
+    (stale-while-revalidate); at most one refresh per key runs at a time.
+    """
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        cached = cache.get(key)
+        if cached is None:
+            return _CACHE_MISS
+        if cached["expires_at"] <= now:
+            del cache[key]
+            return _CACHE_MISS
+        cache.move_to_end(key)
+        data = cached["data"]
+        refresh_key = (id(cache), key)
+        if (
+            refresh is None
+            or cached["refresh_at"] > now
+            or refresh_key in _CACHE_REFRESHING
+        ):
+            return data
+        _CACHE_REFRESHING.add(refresh_key)
+    _EXECUTOR.submit(_run_cache_refresh, refresh_key, refresh)
+    return data
+
+
+def _cache_claim_refresh(cache: OrderedDict[Any, Dict[str, Any]], key: Any) -> bool:
+    """
+    Claim the background refresh of a live entry past its refresh point, as
+    _cache_get(refresh=...) would, for a caller that refreshes several keys in
+    one go. The caller must discard ``(id(cache), key)`` from _CACHE_REFRESHING
+    once done.
+    """
+    now = time.monotonic()
+    refresh_key = (id(cache), key)
+    with _CACHE_LOCK:
+        cached = cache.get(key)
+        if (
+            cached is None
+            or cached["expires_at"] <= now
+            or cached["refresh_at"] > now
+            or refresh_key in _CACHE_REFRESHING
+        ):
+            return False
+        _CACHE_REFRESHING.add(refresh_key)
+    return True
+
+
+def _run_cache_refresh(refresh_key: Tuple[int, Any], refresh: Callable[[], Any]):
+    try:
+        refresh()
+    finally:
+        with _CACHE_LOCK:
+            _CACHE_REFRESHING.discard(refresh_key)
+
+
+def _cache_put(
+    cache: OrderedDict[Any, Dict[str, Any]],
+    key: Any,
+    data: Any,
+    ttl: int,
+    max_entries: int = CACHE_MAX_ENTRIES,
+) -> None:
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        cache[key] = {
+            "expires_at": now + ttl,
+            "refresh_at": now + ttl / 2,
+            "data": data,
+        }
+        cache.move_to_end(key)
+        if len(cache) > max_entries:
+            cache.popitem(last=False)
+
+
+def _cached_fetch(
+    cache: OrderedDict[Any, Dict[str, Any]],
+    key: Any,
+    ttl: int,
+    fetch: Callable[..., Any],
+    max_entries: int = CACHE_MAX_ENTRIES,
+    **kwargs: Any,
+) -> Any:
+    """Return ``fetch(**kwargs)``, reusing a result younger than ``ttl`` seconds."""
+    data = _cache_get(cache, key)
+    if data is _CACHE_MISS:
+        data = fetch(**kwargs)
+        _cache_put(cache, key, data, ttl, max_entries)
+    return data
 
 
 def _format_usd_short(value: Optional[float]) -> str:
@@ -33,18 +187,49 @@ def _format_usd_short(value: Optional[float]) -> str:
         return "N/A"
     sign = "-" if value < 0 else ""
     abs_val = abs(value)
-    for suffix, threshold in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
-        if abs_val >= threshold:
-            return f"{sign}{abs_val / threshold:.2f} {suffix} $"
+    if abs_val >= 1e9:
+        return f"{sign}{abs_val / 1e9:.2f} B $"
+    if abs_val >= 1e6:
+        return f"{sign}{abs_val / 1e6:.2f} M $"
+    if abs_val >= 1e3:
+        return f"{sign}{abs_val / 1e3:.2f} K $"
     if abs_val >= 1:
         return f"{sign}{abs_val:,.2f} $"
     return f"{sign}{abs_val:.4f} $"
 
 
+@lru_cache(maxsize=4096)
+def _format_utc_minute(ts_minute: int) -> str:
+    """Format a timestamp expressed in whole minutes since the epoch (UTC)."""
+    tm = time.gmtime(ts_minute * 60)
+    return "{:04d}-{:02d}-{:02d} {:02d}:{:02d} UTC".format(
+        tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min
+    )
+
+
+def _format_pct(value: float) -> str:
+    return f"{value * 100:.2f} %"
+
+
+# (label key, metric key, formatter, placeholder when the metric is missing)
+_PERFORMANCE_LABELS: Tuple[Tuple[str, str, Callable[[float], str], str], ...] = (
+    ("pnl_abs_label", "pnl_abs", _format_usd_short, "N/A"),
+    ("pnl_pct_label", "pnl_pct", _format_pct, "N/A"),
+    ("annualized_pct_label", "annualized_pct", _format_pct, "N/A"),
+    ("drawdown_pct_label", "drawdown_pct", _format_pct, "N/A"),
+    ("flow_label", "flow_usd", _format_usd_short, "N/A"),
+    ("pnl_component_label", "pnl_component_usd", _format_usd_short, "N/A"),
+    ("tvl_start_label", "tvl_start", _format_usd_short, "N/A"),
+    ("tvl_end_label", "tvl_end", _format_usd_short, "N/A"),
+    ("period_days_label", "period_days", lambda days: f"{days:.1f} j", ""),
+)
+
+
 def _format_timestamp_label(ts: Optional[int]) -> str:
+    """Human friendly UTC label for tooltips / summary cards."""
     if not ts:
         return "N/A"
-    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    return _format_utc_minute(int(ts) // 60)
 
 
 def _summarize_vault(
@@ -92,9 +277,40 @@ def _summarize_vault(
     }
 
 
-def _build_composition_rows(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _as_float(value: Any) -> Optional[float]:
+    """Coerce an API number, possibly sent as a string (BigInt), to float."""
+    if isinstance(value, (int, float)):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class CompositionRow(NamedTuple):
+    """One market allocation of a vault, as rendered in the composition table."""
+
+    title: str
+    assets: str
+    loan_symbol: Optional[str]
+    loan_symbol_upper: str
+    collateral_symbol: Optional[str]
+    market_oracle: Optional[str]
+    market_lltv: Optional[float]
+    market_utilization: Optional[float]
+    market_liquidity_usd: Optional[float]
+    tvl: str
+    tvl_raw: float
+    percent: str
+    percent_value: float
+    enabled: Optional[bool]
+
+
+def _build_composition_rows(state: Dict[str, Any]) -> List[CompositionRow]:
     total = state.get("totalAssetsUsd") or 0.0
-    rows: List[Dict[str, Any]] = []
+    rows: List[CompositionRow] = []
     allocations = state.get("allocation") or []
     for allocation in allocations:
         supply = allocation.get("supplyAssetsUsd")
@@ -110,32 +326,28 @@ def _build_composition_rows(state: Dict[str, Any]) -> List[Dict[str, Any]]:
         collateral = collateral_obj.get("symbol")
         title = market.get("uniqueKey")
         assets = " / ".join([val for val in (loan, collateral) if val])
-        lltv_value = market.get("lltv")
-        if isinstance(lltv_value, str):
-            try:
-                lltv_value = float(lltv_value)
-            except ValueError:
-                lltv_value = None
+        lltv_value = _as_float(market.get("lltv"))
         market_lltv_pct = (lltv_value / 1e16) if lltv_value else None
         oracle_type = oracle_obj.get("type")
         rows.append(
-            {
-                "title": title or assets or "Allocation",
-                "assets": assets or "N/A",
-                "loan_symbol": loan,
-                "collateral_symbol": collateral,
-                "market_oracle": oracle_type,
-                "market_lltv": market_lltv_pct,
-                "market_utilization": market_state.get("utilization"),
-                "market_liquidity_usd": market_state.get("liquidityAssetsUsd"),
-                "tvl": _format_usd_short(supply),
-                "tvl_raw": supply,
-                "percent": f"{percent:.2f} %" if percent is not None else "N/A",
-                "percent_value": percent or 0.0,
-                "enabled": allocation.get("enabled"),
-            }
+            CompositionRow(
+                title=title or assets or "Allocation",
+                assets=assets or "N/A",
+                loan_symbol=loan,
+                loan_symbol_upper=(loan or "").upper(),
+                collateral_symbol=collateral,
+                market_oracle=oracle_type,
+                market_lltv=market_lltv_pct,
+                market_utilization=market_state.get("utilization"),
+                market_liquidity_usd=market_state.get("liquidityAssetsUsd"),
+                tvl=_format_usd_short(supply),
+                tvl_raw=supply,
+                percent=f"{percent:.2f} %" if percent is not None else "N/A",
+                percent_value=percent or 0.0,
+                enabled=allocation.get("enabled"),
+            )
         )
-    rows.sort(key=lambda row: row.get("percent_value", 0.0), reverse=True)
+    rows.sort(key=attrgetter("percent_value"), reverse=True)
     return rows
 
 
@@ -144,9 +356,15 @@ def _compute_performance_metrics(
 ) -> Optional[Dict[str, Any]]:
     usable = [
         p
-        for p in sorted(history_points, key=lambda x: x["timestamp"])
+        for p in history_points
         if p.get("share_price") is not None and p.get("total_assets_usd") is not None
     ]
+    # fetch_vault_history_timeseries already returns points in timestamp order:
+    # only pay for a sort when given unsorted input.
+    if any(
+        a["timestamp"] > b["timestamp"] for a, b in zip(usable, islice(usable, 1, None))
+    ):
+        usable.sort(key=itemgetter("timestamp"))
     if len(usable) < 2:
         return None
     start = usable[0]
@@ -162,34 +380,29 @@ def _compute_performance_metrics(
     if duration_days > 0:
         annualized = (1 + pnl_pct) ** (365 / duration_days) - 1
 
-    peak = usable[0]["share_price"]
+    # Single pass over the series: running peak for the max drawdown, and
+    # per-step split of the TVL change into PnL and net flows.
+    prev_price = start["share_price"]
+    prev_assets = start["total_assets_usd"]
+    peak = prev_price
     max_drawdown = 0.0
-    for point in usable:
+    flow_total = 0.0
+    pnl_component = 0.0
+    for point in islice(usable, 1, None):
         price = point["share_price"]
+        assets = point["total_assets_usd"]
         if price > peak:
             peak = price
-        drawdown = (price - peak) / peak if peak else 0.0
-        if drawdown < max_drawdown:
-            max_drawdown = drawdown
-
-    flow_total = 0.0
-    pnl_component = 0.0
-    prev = usable[0]
-    for current in usable[1:]:
-        prev_assets = prev.get("total_assets_usd")
-        if prev_assets is None:
-            prev = current
-            continue
-        price_ratio = (
-            (current["share_price"] / prev["share_price"]) - 1
-            if prev["share_price"]
-            else 0.0
-        )
+        if peak:
+            drawdown = (price - peak) / peak
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+        price_ratio = (price / prev_price) - 1 if prev_price else 0.0
         pnl_delta = prev_assets * price_ratio
         pnl_component += pnl_delta
-        flow_delta = (current["total_assets_usd"] - prev_assets) - pnl_delta
-        flow_total += flow_delta
-        prev = current
+        flow_total += (assets - prev_assets) - pnl_delta
+        prev_price = price
+        prev_assets = assets
 
     return {
         "pnl_pct": pnl_pct,
@@ -207,7 +420,7 @@ def _compute_performance_metrics(
 
 def _build_risk_summary(
     current_vault: Optional[Dict[str, Any]],
-    composition: List[Dict[str, Any]],
+    composition: List[CompositionRow],
 ) -> List[str]:
     warnings: List[str] = []
     if not current_vault:
@@ -225,71 +438,262 @@ def _build_risk_summary(
             )
 
     high_util_pct = sum(
-        row.get("percent_value", 0.0)
+        row.percent_value
         for row in composition
-        if (row.get("market_utilization") or 0) >= 0.95
+        if (row.market_utilization or 0) >= 0.95
     )
     if high_util_pct >= 30:
         warnings.append(
             f"{high_util_pct:.1f}% du vault est expose a des marches utilises a plus de 95%."
         )
 
-    top3_pct = sum(row.get("percent_value", 0.0) for row in composition[:3])
+    top3_pct = sum(row.percent_value for row in composition[:3])
     if top3_pct >= 60:
         warnings.append(
             f"Concentration elevee: top 3 marches = {top3_pct:.1f}% du vault."
         )
 
-    exotic_tokens = {"XUSD", "DEUSD", "USD0", "USDE"}
     exotic_pct = sum(
-        row.get("percent_value", 0.0)
+        row.percent_value
         for row in composition
-        if (row.get("loan_symbol") or "").upper() in exotic_tokens
+        if row.loan_symbol_upper in EXOTIC_STABLECOINS
     )
     if exotic_pct > 0:
         warnings.append(
-            f"Stablecoins exotiques: {exotic_pct:.1f}% du vault en {', '.join(exotic_tokens)}."
+            f"Stablecoins exotiques: {exotic_pct:.1f}% du vault en {_EXOTIC_STABLECOINS_LABEL}."
         )
 
     return warnings
 
 
+def _build_vault_window_bundle(
+    address: str,
+    chain_id: int,
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+) -> Dict[str, Any]:
+    history_points = fetch_vault_history_timeseries(
+        vault_address=address,
+        chain_id=chain_id,
+        start_ts=start_ts,
+        end_ts=end_ts,
+    )
+    return _vault_window_bundle_from_history(history_points, start_ts, end_ts)
+
+
+def _vault_window_bundle_from_history(
+    history_points: List[Dict[str, Any]],
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+) -> Dict[str, Any]:
+    window_days = (
+        max(1, int((end_ts - start_ts) / 86400))
+        if start_ts is not None and end_ts is not None
+        else None
+    )
+    return {
+        "performance_summary": _compute_performance_metrics(history_points),
+        "tvl_window_summary": (
+            _summarize_tvl_window(history_points, days=window_days)
+            if history_points
+            else None
+        ),
+    }
+
+
+def _vault_window_key(
+    address: str,
+    chain_id: int,
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+) -> Tuple[str, int, Optional[int], Optional[int]]:
+    return (
+        address.lower(),
+        chain_id,
+        start_ts // 3600 if start_ts is not None else None,
+        end_ts // 3600 if end_ts is not None else None,
+    )
+
+
+def _get_vault_window_bundle(
+    address: str,
+    chain_id: int,
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+) -> Dict[str, Any]:
+    """
+    Performance metrics and TVL window summary of a vault over
+    [start_ts, end_ts] (None = full history), cached per hour bucket of the
+    window. The history points themselves are not kept.
+
+    The vault section (date inputs, UTC midnights) and the curator list (a
+    rolling window ending now) use different windows, so in practice each
+    section only reuses its own entries across renders.
+    """
+    return _cached_fetch(
+        VAULT_WINDOW_CACHE,
+        _vault_window_key(address, chain_id, start_ts, end_ts),
+        VAULT_WINDOW_CACHE_TTL,
+        _build_vault_window_bundle,
+        address=address,
+        chain_id=chain_id,
+        start_ts=start_ts,
+        end_ts=end_ts,
+    )
+
+
+def _curator_vault_key(address: str, chain_id: int) -> Tuple[str, int, int]:
+    return (address.lower(), chain_id, CURATOR_VAULT_WINDOW_DAYS)
+
+
+def _curator_vault_window() -> Tuple[int, int]:
+    """The rolling [now - CURATOR_VAULT_WINDOW_DAYS, now] window."""
+    now_ts = int(time.time())
+    return now_ts - CURATOR_VAULT_WINDOW_DAYS * 86400, now_ts
+
+
+def _prefetch_vault_windows(
+    vaults: List[Tuple[str, int]],
+    start_ts: int,
+    end_ts: int,
+) -> None:
+    """
+    Batch the history fetches of a curator's vaults instead of issuing one
+    query per vault:
+
+    - vaults with no cached metrics get their VAULT_WINDOW_CACHE entry filled
+      now, with a single batched query;
+    - vaults whose metrics are stale get their stale-while-revalidate refresh
+      claimed here and run as one batched background job, so the per-vault
+      refreshes of _get_curator_vault_metrics_cached are not scheduled.
+
+    Batch failures are ignored: those vaults go through the per-vault path.
+    """
+    missing: List[Tuple[str, int]] = []
+    stale: List[Tuple[str, int]] = []
+    for address, chain_id in vaults:
+        if not address:
+            continue
+        key = _curator_vault_key(address, chain_id)
+        if _cache_claim_refresh(CURATOR_VAULT_CACHE, key):
+            stale.append((address, chain_id))
+        elif (
+            _cache_get(CURATOR_VAULT_CACHE, key) is _CACHE_MISS
+            and _cache_get(
+                VAULT_WINDOW_CACHE,
+                _vault_window_key(address, chain_id, start_ts, end_ts),
+            )
+            is _CACHE_MISS
+        ):
+            missing.append((address, chain_id))
+    if missing:
+        _fetch_vault_windows(missing, start_ts, end_ts)
+    if stale:
+        _EXECUTOR.submit(_refresh_curator_vault_metrics, stale)
+
+
+def _fetch_vault_windows(
+    vaults: List[Tuple[str, int]],
+    start_ts: int,
+    end_ts: int,
+) -> None:
+    """Fill VAULT_WINDOW_CACHE for ``vaults`` with one batched history query."""
+    try:
+        histories = fetch_vault_histories_batch(
+            [(address, chain_id, start_ts, end_ts) for address, chain_id in vaults]
+        )
+    except Exception:
+        return
+    for (address, chain_id, _, _), history_points in histories.items():
+        _cache_put(
+            VAULT_WINDOW_CACHE,
+            _vault_window_key(address, chain_id, start_ts, end_ts),
+            _vault_window_bundle_from_history(history_points, start_ts, end_ts),
+            VAULT_WINDOW_CACHE_TTL,
+        )
+
+
+def _refresh_curator_vault_metrics(vaults: List[Tuple[str, int]]) -> None:
+    """Batched counterpart of the per-vault curator metrics refresh."""
+    start_ts, end_ts = _curator_vault_window()
+    try:
+        _fetch_vault_windows(
+            [
+                (address, chain_id)
+                for address, chain_id in vaults
+                if _cache_get(
+                    VAULT_WINDOW_CACHE,
+                    _vault_window_key(address, chain_id, start_ts, end_ts),
+                )
+                is _CACHE_MISS
+            ],
+            start_ts,
+            end_ts,
+        )
+        for address, chain_id in vaults:
+            try:
+                _compute_curator_vault_metrics(
+                    address, chain_id, start_ts, end_ts, refreshing=True
+                )
+            except Exception:
+                pass
+    finally:
+        with _CACHE_LOCK:
+            for address, chain_id in vaults:
+                key = _curator_vault_key(address, chain_id)
+                _CACHE_REFRESHING.discard((id(CURATOR_VAULT_CACHE), key))
+
+
 def _get_curator_vault_metrics_cached(
     address: str,
     chain_id: int,
     start_ts: int,
     end_ts: int,
 ) -> Dict[str, str]:
-    key = (address.lower(), chain_id, start_ts // 3600, end_ts // 3600)
-    now = int(time.time())
-    cached = CURATOR_VAULT_CACHE.get(key)
-    if cached and (now - cached["timestamp"] < CURATOR_VAULT_CACHE_TTL):
-        return cached["data"]
+    """
+    Curator list metrics of a vault over the rolling window [start_ts, end_ts].
+
+    Entries are keyed on the window length rather than its bounds, so they
+    survive the window rolling forward; a stale entry is refreshed in the
+    background over the window as of the refresh.
+    """
+    cached = _cache_get(
+        CURATOR_VAULT_CACHE,
+        _curator_vault_key(address, chain_id),
+        refresh=lambda: _compute_curator_vault_metrics(
+            address, chain_id, *_curator_vault_window(), refreshing=True
+        ),
+    )
+    if cached is not _CACHE_MISS:
+        return cached
+    return _compute_curator_vault_metrics(address, chain_id, start_ts, end_ts)
+
 
+def _compute_curator_vault_metrics(
+    address: str,
+    chain_id: int,
+    start_ts: int,
+    end_ts: int,
+    refreshing: bool = False,
+) -> Dict[str, str]:
     pnl_label = "N/A"
     tvl_change_label = "N/A"
     tvl_pct_label = "N/A"
     metrics = None
     try:
-        metrics = None
-        history_points = fetch_vault_history_timeseries(
-            vault_address=address,
-            chain_id=chain_id,
-            start_ts=start_ts,
-            end_ts=end_ts,
-        )
-        if history_points:
-            metrics = _compute_performance_metrics(history_points)
-            if metrics and metrics.get("pnl_pct") is not None:
-                pnl_label = f"{metrics['pnl_pct'] * 100:.2f} %"
-            window_summary = _summarize_tvl_window(
-                history_points, days=CURATOR_VAULT_WINDOW_DAYS
-            )
-            if window_summary:
-                tvl_change_label = window_summary.get("change", "N/A")
-                tvl_pct_label = window_summary.get("pct", "N/A")
+        bundle = _get_vault_window_bundle(address, chain_id, start_ts, end_ts)
+        metrics = bundle["performance_summary"]
+        if metrics and metrics.get("pnl_pct") is not None:
+            pnl_label = f"{metrics['pnl_pct'] * 100:.2f} %"
+        window_summary = bundle["tvl_window_summary"]
+        if window_summary:
+            tvl_change_label = window_summary.get("change", "N/A")
+            tvl_pct_label = window_summary.get("pct", "N/A")
     except Exception:
-        pass
+        # A failed background refresh keeps serving the stale entry; only a
+        # cache miss stores the N/A placeholder.
+        if refreshing:
+            raise
 
     pnl_abs = metrics.get("pnl_abs") if metrics else None
     data = {
@@ -299,7 +703,12 @@ def _get_curator_vault_metrics_cached(
         "tvl_pct_30d": tvl_pct_label,
         "pnl_abs_raw": pnl_abs,
     }
-    CURATOR_VAULT_CACHE[key] = {"timestamp": now, "data": data}
+    _cache_put(
+        CURATOR_VAULT_CACHE,
+        _curator_vault_key(address, chain_id),
+        data,
+        CURATOR_VAULT_CACHE_TTL,
+    )
     return data
 
 
@@ -307,22 +716,38 @@ def _summarize_tvl_window(
     history_points: List[Dict[str, Any]],
     days: Optional[int] = 30,
 ) -> Optional[Dict[str, Any]]:
-    usable = sorted(
-        [p for p in history_points if p.get("total_assets_usd") is not None],
-        key=lambda x: x["timestamp"],
-    )
-    if len(usable) < 2:
+    # Only the earliest/latest usable points and the earliest point inside the
+    # window are needed: find them with two linear scans instead of sorting.
+    first: Optional[Dict[str, Any]] = None
+    last: Optional[Dict[str, Any]] = None
+    usable_count = 0
+    for p in history_points:
+        if p.get("total_assets_usd") is None:
+            continue
+        usable_count += 1
+        ts = p["timestamp"]
+        if first is None or ts < first["timestamp"]:
+            first = p
+        if last is None or ts >= last["timestamp"]:
+            last = p
+    if usable_count < 2:
         return None
-    latest_ts = usable[-1]["timestamp"]
+    latest_ts = last["timestamp"]
     window_days = days
     if window_days is None or window_days <= 0:
-        window_days = max(1, int((latest_ts - usable[0]["timestamp"]) / 86400))
+        window_days = max(1, int((latest_ts - first["timestamp"]) / 86400))
     cutoff = latest_ts - window_days * 86400
-    window_points = [p for p in usable if p["timestamp"] >= cutoff]
-    if len(window_points) < 2:
-        window_points = usable
-    start = window_points[0]
-    end = window_points[-1]
+    start = None
+    window_count = 0
+    for p in history_points:
+        if p.get("total_assets_usd") is None or p["timestamp"] < cutoff:
+            continue
+        window_count += 1
+        if start is None or p["timestamp"] < start["timestamp"]:
+            start = p
+    if window_count < 2:
+        start = first
+    end = last
     change = end["total_assets_usd"] - start["total_assets_usd"]
     start_label = _format_usd_short(start["total_assets_usd"])
     end_label = _format_usd_short(end["total_assets_usd"])
@@ -338,27 +763,100 @@ def _summarize_tvl_window(
     }
 
 
+def _fetch_curator_with_vaults(
+    curator_query: str,
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Resolve a curator (slug or address) and list its vaults."""
+    curator_info = _cached_fetch(
+        CURATOR_PROFILE_CACHE,
+        curator_query,
+        CURATOR_PROFILE_CACHE_TTL,
+        fetch_curator_profile,
+        curator_query=curator_query,
+    )
+    if curator_info is None:
+        return None, []
+    return curator_info, fetch_vaults_for_curator(curator_info["id"])
+
+
 def _default_dates() -> tuple[str, str]:
     """Return ISO strings for the default start/end date inputs."""
-    today = datetime.utcnow().date()
+    return _default_dates_for(datetime.now(timezone.utc).date())
+
+
+@lru_cache(maxsize=1)
+def _default_dates_for(today: date) -> tuple[str, str]:
     start = today - timedelta(days=DEFAULT_RANGE_DAYS)
     return start.isoformat(), today.isoformat()
 
 
-def _format_timestamp(ts: int) -> str:
-    """Human friendly UTC label for tooltips / summary cards."""
-    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+def _get_network_slug(chain_id: int) -> Optional[str]:
+    return get_network_by_id(chain_id)
 
 
-def _get_network_slug(chain_id: int) -> Optional[str]:
-    for net in networks:
-        if net.get("id") == chain_id:
-            return net.get("network")
-    return None
+@app.after_request
+def _gzip_response(response: Response) -> Response:
+    """Gzip HTML/JSON bodies for clients that accept it."""
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    # The body bytes differ from the identity encoding: keep the validator
+    # usable for If-None-Match (weak comparison) but no longer strong.
+    etag, _ = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def _build_page(html: str) -> Dict[str, Any]:
+    """Encode a render once: body, gzipped body (if worth it) and validators."""
+    body = html.encode("utf-8")
+    return {
+        "body": body,
+        "gzip_body": (
+            gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+            if len(body) >= COMPRESS_MIN_SIZE
+            else None
+        ),
+        "etag": generate_etag(body),
+        "last_modified": datetime.now(timezone.utc),
+    }
+
+
+def _page_response(page: Dict[str, Any]) -> Response:
+    response = make_response(page["body"])
+    response.last_modified = page["last_modified"]
+    response.vary.add("Accept-Encoding")
+    if page["gzip_body"] is not None and request.accept_encodings["gzip"]:
+        # Pre-compressed: _gzip_response leaves encoded bodies alone.
+        response.set_data(page["gzip_body"])
+        response.headers["Content-Encoding"] = "gzip"
+        response.set_etag(page["etag"], weak=True)
+    else:
+        response.set_etag(page["etag"])
+    # Let browsers revalidate an identical render with a bodyless 304.
+    return response.make_conditional(request)
 
 
 @app.route("/", methods=["GET"])
 def index():
+    page_key = request.query_string
+    page = _cache_get(PAGE_CACHE, page_key)
+    if page is not _CACHE_MISS:
+        return _page_response(page)
+
     start_default, end_default = _default_dates()
 
     start_date = request.args.get("start_date") or start_default
@@ -368,19 +866,19 @@ def index():
 
     full_history = request.args.get("full_history") == "1"
 
-    chart_points: List[Dict[str, float]] = []
+    chart_points_json: Optional[str] = None
     summary: Optional[Dict[str, float]] = None
     error: Optional[str] = None
     morpho_url: Optional[str] = None
     network_slug: Optional[str] = None
     current_vault: Optional[Dict[str, Any]] = None
     current_vault_error: Optional[str] = None
-    vault_composition: List[Dict[str, Any]] = []
-    history_points: List[Dict[str, Any]] = []
+    # Set when a section silently fell back to "no data" after an error.
+    partial_render = False
+    vault_composition: List[CompositionRow] = []
     performance_summary: Optional[Dict[str, Any]] = None
     risk_summary: List[str] = []
     tvl_window_summary: Optional[Dict[str, Any]] = None
-    tvl_window_days: Optional[int] = None
 
     curator_query = (request.args.get("curator") or "").strip()
     curator_info: Optional[Dict[str, Any]] = None
@@ -390,6 +888,12 @@ def index():
     curator_open = (
         curator_open_param == "1" if curator_open_param is not None else False
     )
+    # Resolve the curator in the background while the vault section loads.
+    curator_future = (
+        _EXECUTOR.submit(_fetch_curator_with_vaults, curator_query)
+        if curator_query
+        else None
+    )
 
     if vault_address and selected_network_id:
         try:
@@ -405,12 +909,39 @@ def index():
                         "La date de fin doit etre strictement posterieure a la date de debut."
                     )
 
-                raw_series = fetch_share_price_usd_series(
+                series_start = None if full_history else start_ts
+                series_end = None if full_history else end_ts
+                # The three upstream calls are independent: run them
+                # concurrently so the page waits for the slowest one only.
+                series_future = _EXECUTOR.submit(
+                    _cached_fetch,
+                    SHARE_PRICE_CACHE,
+                    (vault_address.lower(), chain_id, series_start, series_end),
+                    SHARE_PRICE_CACHE_TTL,
+                    fetch_share_price_usd_series,
+                    max_entries=SHARE_PRICE_CACHE_MAX_ENTRIES,
+                    vault_address=vault_address,
+                    chain_id=chain_id,
+                    start_ts=series_start,
+                    end_ts=series_end,
+                )
+                window_future = _EXECUTOR.submit(
+                    _get_vault_window_bundle,
+                    vault_address,
+                    chain_id,
+                    series_start,
+                    series_end,
+                )
+                details_future = _EXECUTOR.submit(
+                    _cached_fetch,
+                    VAULT_DETAILS_CACHE,
+                    (vault_address.lower(), chain_id),
+                    VAULT_DETAILS_CACHE_TTL,
+                    fetch_vault_details,
                     vault_address=vault_address,
                     chain_id=chain_id,
-                    start_ts=None if full_history else start_ts,
-                    end_ts=None if full_history else end_ts,
                 )
+                raw_series = series_future.result()
                 if not raw_series:
                     raise ValueError(
                         "Il n'y a pas de points sharePriceUsd pour cette periode."
@@ -425,86 +956,50 @@ def index():
                     )
                 pnl_decimal = compute_pnl_from_prices(start_point[1], end_point[1])
 
-                chart_points = [
-                    {"timestamp": ts * 1000, "value": value} for ts, value in raw_series
-                ]
+                # Columnar payload (the template zips it back into points):
+                # no per-point dict and no repeated keys in the JSON. It only
+                # holds numbers, so it is encoded once here and injected raw.
+                timestamps, values = zip(*raw_series)
+                chart_points_json = json.dumps(
+                    {"t": [ts * 1000 for ts in timestamps], "v": values},
+                    separators=(",", ":"),
+                )
                 summary = {
                     "start_ts": start_point[0],
                     "end_ts": end_point[0],
-                    "start_label": _format_timestamp(start_point[0]),
-                    "end_label": _format_timestamp(end_point[0]),
+                    "start_label": _format_timestamp_label(start_point[0]),
+                    "end_label": _format_timestamp_label(end_point[0]),
                     "start_price": start_point[1],
                     "end_price": end_point[1],
                     "pnl_decimal": pnl_decimal,
                     "is_full_history": full_history,
                 }
-                if not full_history:
-                    tvl_window_days = max(1, int((end_ts - start_ts) / 86400))
-                else:
-                    tvl_window_days = None
-                history_start = None if full_history else start_ts
-                history_end = None if full_history else end_ts
                 try:
-                    history_points = fetch_vault_history_timeseries(
-                        vault_address=vault_address,
-                        chain_id=chain_id,
-                        start_ts=history_start,
-                        end_ts=history_end,
-                    )
+                    window_bundle = window_future.result()
                 except Exception:
-                    history_points = []
-                performance_summary = _compute_performance_metrics(history_points)
-                if performance_summary:
-                    performance_summary["pnl_abs_label"] = _format_usd_short(
-                        performance_summary.get("pnl_abs")
+                    window_bundle = None
+                    partial_render = True
+                if window_bundle:
+                    tvl_window_summary = window_bundle["tvl_window_summary"]
+                    # Copied: the label keys below must not leak into the cache.
+                    performance_summary = (
+                        dict(window_bundle["performance_summary"])
+                        if window_bundle["performance_summary"]
+                        else None
                     )
-                    performance_summary["pnl_pct_label"] = (
-                        f"{performance_summary['pnl_pct'] * 100:.2f} %"
-                        if performance_summary.get("pnl_pct") is not None
-                        else "N/A"
-                    )
-                    performance_summary["annualized_pct_label"] = (
-                        f"{performance_summary['annualized_pct'] * 100:.2f} %"
-                        if performance_summary.get("annualized_pct") is not None
-                        else "N/A"
-                    )
-                    performance_summary["drawdown_pct_label"] = (
-                        f"{performance_summary['drawdown_pct'] * 100:.2f} %"
-                        if performance_summary.get("drawdown_pct") is not None
-                        else "N/A"
-                    )
-                    performance_summary["flow_label"] = _format_usd_short(
-                        performance_summary.get("flow_usd")
-                    )
-                    performance_summary["pnl_component_label"] = _format_usd_short(
-                        performance_summary.get("pnl_component_usd")
-                    )
-                    performance_summary["tvl_start_label"] = _format_usd_short(
-                        performance_summary.get("tvl_start")
-                    )
-                    performance_summary["tvl_end_label"] = _format_usd_short(
-                        performance_summary.get("tvl_end")
-                    )
-                    performance_summary["period_days_label"] = (
-                        f"{performance_summary['period_days']:.1f} j"
-                        if performance_summary.get("period_days") is not None
-                        else ""
-                    )
-                tvl_window_summary = (
-                    _summarize_tvl_window(history_points, days=tvl_window_days)
-                    if history_points
-                    else None
-                )
+                if performance_summary:
+                    for label, key, fmt, missing in _PERFORMANCE_LABELS:
+                        value = performance_summary.get(key)
+                        performance_summary[label] = (
+                            fmt(value) if value is not None else missing
+                        )
                 network_slug = _get_network_slug(chain_id)
                 if network_slug:
                     morpho_url = (
                         f"{MORPHO_SITE_URL}{network_slug}/vault/{vault_address}"
                     )
                 try:
-                    current_vault_data = fetch_vault_details(
-                        vault_address=vault_address,
-                        chain_id=chain_id,
-                    )
+                    current_vault_data = details_future.result()
                 except Exception as exc:  # pragma: no cover
                     current_vault_error = str(exc)
                     current_vault_data = None
@@ -523,50 +1018,64 @@ def index():
             except Exception as exc:  # pragma: no cover - surface message to UI
                 error = str(exc)
 
-    if curator_query:
+    if curator_future is not None:
         try:
-            curator_info = fetch_curator_profile(curator_query)
+            curator_info, raw_curator_vaults = curator_future.result()
             if curator_info is None:
                 curator_error = "Aucun curator ne correspond a cette valeur."
             else:
-                raw_curator_vaults = fetch_vaults_for_curator(curator_info["id"])
-                curator_vaults = []
-                now_ts = int(datetime.utcnow().timestamp())
-                start_window_ts = now_ts - CURATOR_VAULT_WINDOW_DAYS * 86400
-                for item in raw_curator_vaults:
-                    chain_id = (item.get("chain") or {}).get("id")
-                    total_assets = (item.get("state") or {}).get("totalAssetsUsd")
-                    metrics_cached = _get_curator_vault_metrics_cached(
-                        item.get("address"),
-                        chain_id,
-                        start_window_ts,
-                        now_ts,
-                    )
-                    curator_vaults.append(
-                        {
-                            "id": item.get("id"),
-                            "name": item.get("name"),
-                            "address": item.get("address"),
-                            "whitelisted": item.get("whitelisted"),
-                            "chain_id": chain_id,
-                            "network": get_network_by_id(chain_id) or chain_id,
-                            "asset_symbol": (item.get("asset") or {}).get("symbol"),
-                            "total_assets_usd": total_assets,
-                            "display_tvl": _format_usd_short(total_assets),
-                            **metrics_cached,
-                        }
+                start_window_ts, now_ts = _curator_vault_window()
+                addresses = [item.get("address") for item in raw_curator_vaults]
+                chain_ids = [
+                    (item.get("chain") or {}).get("id") for item in raw_curator_vaults
+                ]
+                # Cache misses share one batched history query; whatever it
+                # could not fill falls back to one fetch per vault on the pool.
+                _prefetch_vault_windows(
+                    list(zip(addresses, chain_ids)), start_window_ts, now_ts
+                )
+                all_metrics = list(
+                    _EXECUTOR.map(
+                        _get_curator_vault_metrics_cached,
+                        addresses,
+                        chain_ids,
+                        repeat(start_window_ts),
+                        repeat(now_ts),
                     )
-                curator_vaults.sort(
-                    key=lambda vault: abs(vault.get("pnl_abs_raw") or 0.0),
-                    reverse=True,
                 )
+                # Largest absolute PnL first (ties keep the upstream order): sort
+                # the indices on keys computed once, then build rows in order.
+                sort_keys = [
+                    -abs(metrics.get("pnl_abs_raw") or 0.0) for metrics in all_metrics
+                ]
+                order = sorted(
+                    range(len(raw_curator_vaults)), key=sort_keys.__getitem__
+                )
+                curator_vaults = [None] * len(order)
+                for pos, i in enumerate(order):
+                    item = raw_curator_vaults[i]
+                    chain_id = chain_ids[i]
+                    total_assets = (item.get("state") or {}).get("totalAssetsUsd")
+                    metrics_cached = all_metrics[i]
+                    curator_vaults[pos] = {
+                        "id": item.get("id"),
+                        "name": item.get("name"),
+                        "address": item.get("address"),
+                        "whitelisted": item.get("whitelisted"),
+                        "chain_id": chain_id,
+                        "network": _get_network_slug(chain_id) or chain_id,
+                        "asset_symbol": (item.get("asset") or {}).get("symbol"),
+                        "total_assets_usd": total_assets,
+                        "display_tvl": _format_usd_short(total_assets),
+                        **metrics_cached,
+                    }
         except Exception as exc:  # pragma: no cover
             curator_error = str(exc)
 
     if curator_open_param is None and (curator_vaults or curator_error):
         curator_open = True
 
-    return render_template(
+    html = render_template(
         "index.html",
         networks=networks,
         selected_network_id=(
@@ -576,7 +1085,7 @@ def index():
         start_date=start_date,
         end_date=end_date,
         full_history=full_history,
-        chart_points=chart_points,
+        chart_points_json=chart_points_json,
         summary=summary,
         error=error,
         morpho_url=morpho_url,
@@ -589,12 +1098,20 @@ def index():
         current_vault=current_vault,
         current_vault_error=current_vault_error,
         vault_composition=vault_composition,
-        history_points=history_points,
         performance_summary=performance_summary,
         risk_summary=False,
         tvl_window_summary=tvl_window_summary,
         curator_window_days=CURATOR_VAULT_WINDOW_DAYS,
     )
+    page = _build_page(html)
+    # Upstream failures are usually transient: only keep complete renders.
+    if not (error or current_vault_error or curator_error or partial_render):
+        _cache_put(PAGE_CACHE, page_key, page, PAGE_CACHE_TTL, PAGE_CACHE_MAX_ENTRIES)
+    return _page_response(page)
+
+
+# Compile (or load from the bytecode cache) up front, not on the first request.
+app.jinja_env.get_template("index.html")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,42 @@
-import requests
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Tuple, Dict, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import List, Tuple, Dict, Any, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional, faster JSON codec for the large timeseries payloads
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 MORPHO_API_URL = "https://api.morpho.org/graphql"
 
+# (connect, read) timeouts in seconds for calls to the Morpho API.
+HTTP_TIMEOUT = (3.05, 30)
+
 MORPHO_SITE_URL = "https://app.morpho.org/"
 
+# On-disk cache of share price series whose window is settled (ended more
+# than SERIES_CACHE_SETTLED_AFTER seconds ago).
+SERIES_CACHE_DIR = Path("~/.cache/morpho/share_price").expanduser()
+SERIES_CACHE_SETTLED_AFTER = 86400
+# The least recently written files beyond this count are pruned on write.
+SERIES_CACHE_MAX_FILES = 2048
+
+# Length in seconds of the windows fetched at each end of a PnL period.
+EDGE_WINDOW = 86400
+
 networks = [
     {"id": 1, "network": "ethereum"},
     {"id": 8453, "network": "base"},
@@ -19,14 +50,90 @@ networks = [
     {"id": 999, "network": "hyperliquid"},
 ]
 
+_NETWORK_BY_ID: Dict[int, str] = {
+    n["id"]: n["network"]
+    for n in networks
+    if n.get("id") is not None and n.get("network")
+}
+_ID_BY_NETWORK: Dict[str, int] = {
+    network: chain_id for chain_id, network in _NETWORK_BY_ID.items()
+}
+
+
+def _build_http_session() -> requests.Session:
+    """
+    Build the pooled session shared by every Morpho API call of the process.
+    Connections are opened lazily, so the session is safe to create at import
+    time (before WSGI workers fork).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=2,
+            # Never replay after a read timeout: one hung call would otherwise
+            # hold the caller for several HTTP_TIMEOUT read periods.
+            read=0,
+            backoff_factor=0.2,
+            # 429 and 503 honour the server's Retry-After header.
+            status_forcelist=[429, 502, 503, 504],
+            # GraphQL reads are sent as POST but are safe to replay.
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "vaults/1",
+        }
+    )
+    return session
+
+
+_HTTP = _build_http_session()
+# Independent Morpho calls are I/O bound (requests releases the GIL while
+# waiting), so the *_many helpers overlap them on this pool.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Short-lived LRU of raw GraphQL responses, keyed on (query, variables JSON).
+GRAPHQL_CACHE_TTL = 60
+GRAPHQL_CACHE_MAX_ENTRIES = 512
+_GRAPHQL_CACHE: "OrderedDict[Tuple[str, bytes], Tuple[float, bytes]]" = OrderedDict()
+_GRAPHQL_CACHE_LOCK = threading.Lock()
+
 
+@lru_cache(maxsize=1024)
 def iso_date_to_unix_timestamp(date_str: str) -> int:
     """
     Convert an ISO-like date string (e.g. '2024-10-01' or '2024-10-01 12:00')
     to a Unix timestamp (seconds since epoch, UTC).
     """
-    # Try full datetime with time first
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+    # Fast path for the common 'YYYY-MM-DD' form, without strptime.
+    digits = date_str[:4] + date_str[5:7] + date_str[8:]
+    if (
+        len(date_str) == 10
+        and date_str[4] == date_str[7] == "-"
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        try:
+            dt = datetime(
+                int(date_str[:4]),
+                int(date_str[5:7]),
+                int(date_str[8:]),
+                tzinfo=timezone.utc,
+            )
+            return int(dt.timestamp())
+        except ValueError:
+            pass
+
+    # Formats are mutually exclusive: try the most common one first.
+    for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"):
         try:
             dt = datetime.strptime(date_str, fmt)
             # Assume UTC (API works with UTC timestamps)
@@ -38,23 +145,156 @@ def iso_date_to_unix_timestamp(date_str: str) -> int:
     raise ValueError(f"Unsupported date format: '{date_str}'")
 
 
-def run_graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def clear_graphql_cache() -> None:
+    with _GRAPHQL_CACHE_LOCK:
+        _GRAPHQL_CACHE.clear()
+
+
+def run_graphql_query(
+    query: str,
+    variables: Dict[str, Any],
+    allow_partial: bool = False,
+) -> Dict[str, Any]:
     """
     Execute a GraphQL query against the Morpho API and return the 'data' field.
     Raises an error if HTTP error or GraphQL error occurs.
+
+    With ``allow_partial``, errors scoped to a root field (a one-element
+    ``path``) leave that field null in the returned data instead of raising;
+    errors about the whole document or nested inside a field still raise,
+    since those can leave a non-null field with holes in it.
+
+    Successful, error-free responses are reused for GRAPHQL_CACHE_TTL seconds
+    for the same (query, variables); each call gets its own freshly decoded
+    copy.
     """
-    response = requests.post(
+    key = (query, _json_dumps(variables, sort_keys=True))
+    now = time.monotonic()
+    with _GRAPHQL_CACHE_LOCK:
+        cached = _GRAPHQL_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            _GRAPHQL_CACHE.move_to_end(key)
+            return _json_loads(cached[1])
+
+    response = _HTTP.post(
         MORPHO_API_URL,
-        json={"query": query, "variables": variables},
-        timeout=30,
+        data=_json_dumps({"query": query, "variables": variables}),
+        headers={"Content-Type": "application/json"},
+        timeout=HTTP_TIMEOUT,
     )
     response.raise_for_status()
-    payload = response.json()
+    payload = _json_loads(response.content)
+
+    errors = payload.get("errors")
+    if errors:
+        if (
+            not allow_partial
+            or payload.get("data") is None
+            or not all(len(error.get("path") or ()) == 1 for error in errors)
+        ):
+            raise RuntimeError(f"GraphQL errors: {errors}")
+        return payload["data"]
+
+    data = payload.get("data", {})
+    with _GRAPHQL_CACHE_LOCK:
+        _GRAPHQL_CACHE[key] = (now + GRAPHQL_CACHE_TTL, _json_dumps(data))
+        _GRAPHQL_CACHE.move_to_end(key)
+        if len(_GRAPHQL_CACHE) > GRAPHQL_CACHE_MAX_ENTRIES:
+            _GRAPHQL_CACHE.popitem(last=False)
+    return data
+
+
+def _settled_series_path(
+    vault_address: str,
+    chain_id: int,
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+    interval: Optional[str],
+) -> Optional[Path]:
+    """
+    Disk cache file for a share price window that ended more than a day ago
+    (its points can no longer change), or None if the window is not cacheable.
+    """
+    if (
+        start_ts is None
+        or end_ts is None
+        or end_ts >= time.time() - SERIES_CACHE_SETTLED_AFTER
+        or not looks_like_address(vault_address)
+    ):
+        return None
+    name = f"{chain_id}-{vault_address.lower()}-{start_ts}-{end_ts}-{interval or 'all'}"
+    return SERIES_CACHE_DIR / f"{name}.json"
+
 
-    if "errors" in payload:
-        raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+def _read_settled_series(path: Path) -> Optional[List[Tuple[int, float]]]:
+    try:
+        return [(ts, value) for ts, value in _json_loads(path.read_bytes())]
+    except (OSError, ValueError, TypeError):
+        return None
 
-    return payload.get("data", {})
+
+def _write_settled_series(path: Path, series: List[Tuple[int, float]]) -> None:
+    # Best effort: write to a temp file and rename so readers never see a
+    # partial file; any I/O error just leaves the window uncached. The temp
+    # name is unique per thread as pool workers may write the same window.
+    tmp_path = path.with_name(
+        f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_json_dumps(series))
+        os.replace(tmp_path, path)
+        _prune_settled_series(path.parent)
+    except OSError:
+        pass
+
+
+def _prune_settled_series(directory: Path) -> None:
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+    if len(entries) <= SERIES_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, stale_path in entries[: len(entries) - SERIES_CACHE_MAX_FILES]:
+        try:
+            os.remove(stale_path)
+        except OSError:
+            pass
+
+
+_VAULT_SHARE_PRICE_HISTORY_QUERY = """
+query VaultSharePriceHistory(
+  $address: String!,
+  $chainId: Int!,
+  $options: TimeseriesOptions
+) {
+  vaultByAddress(address: $address, chainId: $chainId) {
+    historicalState {
+      sharePriceUsd(options: $options) {
+        x
+        y
+      }
+    }
+  }
+}
+"""
 
 
 def fetch_share_price_usd_series(
@@ -62,101 +302,62 @@ def fetch_share_price_usd_series(
     chain_id: int,
     start_ts: Optional[int] = None,
     end_ts: Optional[int] = None,
+    interval: Optional[str] = None,
+    disk_cache: bool = False,
 ) -> List[Tuple[int, float]]:
     """
     Fetch sharePriceUsd time series for a given vault between start_ts and end_ts.
 
     Returns a list of (timestamp, share_price_usd) tuples sorted by timestamp.
     Uses the 'historicalState.sharePriceUsd(options: TimeseriesOptions)' field.
-    """
+    ``interval`` (a TimeseriesInterval such as "HOUR" or "DAY") lets the API
+    downsample the series; by default every point is returned.
 
-    query = """
-    query VaultSharePriceHistory(
-      $address: String!,
-      $chainId: Int!,
-      $options: TimeseriesOptions
-    ) {
-      vaultByAddress(address: $address, chainId: $chainId) {
-        address
-        name
-        asset {
-          symbol
-          decimals
-        }
-        historicalState {
-          sharePriceUsd(options: $options) {
-            x
-            y
-          }
-        }
-      }
-    }
+    With ``disk_cache``, windows that ended more than a day ago are kept on
+    disk in SERIES_CACHE_DIR (at most SERIES_CACHE_MAX_FILES files) and served
+    from there on later calls. The compute_* helpers opt in; the web app keeps
+    to its in-memory caches.
     """
+    cache_path = (
+        _settled_series_path(vault_address, chain_id, start_ts, end_ts, interval)
+        if disk_cache
+        else None
+    )
+    if cache_path is not None:
+        cached = _read_settled_series(cache_path)
+        if cached is not None:
+            return cached
 
-    options: Dict[str, int] = {}
-    if start_ts is not None:
-        options["startTimestamp"] = start_ts
-    if end_ts is not None:
-        options["endTimestamp"] = end_ts
-
-    variables: Dict[str, Any] = {
-        "address": vault_address,
-        "chainId": chain_id,
-        "options": options or None,
-    }
+    variables = _build_series_variables(
+        vault_address, chain_id, start_ts, end_ts, interval
+    )
 
-    data = run_graphql_query(query, variables)
+    data = run_graphql_query(_VAULT_SHARE_PRICE_HISTORY_QUERY, variables)
 
     vault_data = data.get("vaultByAddress")
     if vault_data is None:
         raise ValueError("Vault not found for given address / chainId.")
 
-    hist = vault_data.get("historicalState")
-    if hist is None or hist.get("sharePriceUsd") is None:
+    series_raw = (vault_data.get("historicalState") or {}).get("sharePriceUsd")
+    if series_raw is None:
         raise ValueError("No historical sharePriceUsd data available for this vault.")
 
-    series_raw = hist["sharePriceUsd"]
-
     # series_raw is expected to be a list of { "x": timestamp, "y": value }
-    series: List[Tuple[int, float]] = []
-    for point in series_raw:
-        ts = int(point["x"])
-        value = float(point["y"])
-        series.append((ts, value))
-
-    # Sort by timestamp, just in case
-    series.sort(key=lambda p: p[0])
+    series: List[Tuple[int, float]] = [
+        (int(point["x"]), float(point["y"])) for point in series_raw
+    ]
+
+    # The API returns points in timestamp order: only sort if it did not.
+    if any(a[0] > b[0] for a, b in zip(series, islice(series, 1, None))):
+        series.sort(key=lambda p: p[0])
+    if cache_path is not None:
+        _write_settled_series(cache_path, series)
     return series
 
 
-def fetch_vault_history_timeseries(
-    vault_address: str,
-    chain_id: int,
-    start_ts: Optional[int] = None,
-    end_ts: Optional[int] = None,
-    interval: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    query = """
-    query VaultHistory(
-      $address: String!,
-      $chainId: Int!,
-      $options: TimeseriesOptions
-    ) {
-      vaultByAddress(address: $address, chainId: $chainId) {
-        historicalState {
-          sharePriceUsd(options: $options) {
-            x
-            y
-          }
-          totalAssetsUsd(options: $options) {
-            x
-            y
-          }
-        }
-      }
-    }
-    """
-
+def _timeseries_options(
+    start_ts: Optional[int], end_ts: Optional[int], interval: Optional[str]
+) -> Optional[Dict[str, Any]]:
     options: Dict[str, Any] = {}
     if start_ts is not None:
         options["startTimestamp"] = start_ts
@@ -164,19 +365,26 @@ def fetch_vault_history_timeseries(
         options["endTimestamp"] = end_ts
     if interval is not None:
         options["interval"] = interval
+    return options or None
+
 
-    variables: Dict[str, Any] = {
+def _build_series_variables(
+    vault_address: str,
+    chain_id: int,
+    start_ts: Optional[int],
+    end_ts: Optional[int],
+    interval: Optional[str],
+) -> Dict[str, Any]:
+    """Variables of the single-vault timeseries queries."""
+    return {
         "address": vault_address,
         "chainId": chain_id,
-        "options": options or None,
+        "options": _timeseries_options(start_ts, end_ts, interval),
     }
 
-    data = run_graphql_query(query, variables)
-    vault_data = data.get("vaultByAddress")
-    if vault_data is None:
-        raise ValueError("Vault not found for given address / chainId.")
 
-    historical = (vault_data.get("historicalState") or {}) if vault_data else {}
+def _merge_vault_history(vault_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    historical = vault_data.get("historicalState") or {}
 
     def merge_series(
         source: List[Dict[str, Any]], key: str
@@ -202,6 +410,104 @@ def fetch_vault_history_timeseries(
     return points
 
 
+_VAULT_HISTORY_QUERY = """
+query VaultHistory(
+  $address: String!,
+  $chainId: Int!,
+  $options: TimeseriesOptions
+) {
+  vaultByAddress(address: $address, chainId: $chainId) {
+    historicalState {
+      sharePriceUsd(options: $options) {
+        x
+        y
+      }
+      totalAssetsUsd(options: $options) {
+        x
+        y
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_vault_history_timeseries(
+    vault_address: str,
+    chain_id: int,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+    interval: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch the sharePriceUsd and totalAssetsUsd history of a vault, merged per
+    timestamp.
+
+    Returns a list of {"timestamp", "share_price", "total_assets_usd"} dicts
+    sorted by timestamp (ascending); a key is absent when the API has no value
+    for that series at that timestamp.
+    """
+    variables = _build_series_variables(
+        vault_address, chain_id, start_ts, end_ts, interval
+    )
+
+    data = run_graphql_query(_VAULT_HISTORY_QUERY, variables)
+    vault_data = data.get("vaultByAddress")
+    if vault_data is None:
+        raise ValueError("Vault not found for given address / chainId.")
+
+    return _merge_vault_history(vault_data)
+
+
+def fetch_vault_histories_batch(
+    keys: List[Tuple[str, int, Optional[int], Optional[int]]],
+    batch_size: int = 25,
+) -> Dict[Tuple[str, int, Optional[int], Optional[int]], List[Dict[str, Any]]]:
+    """
+    Same as fetch_vault_history_timeseries for several
+    (vault_address, chain_id, start_ts, end_ts) keys, with one aliased GraphQL
+    query per ``batch_size`` vaults instead of one request per vault.
+
+    Returns the history points per key. A vault the API reports an error for
+    (e.g. unknown address) is omitted without failing the rest of its batch.
+    """
+    histories: Dict[
+        Tuple[str, int, Optional[int], Optional[int]], List[Dict[str, Any]]
+    ] = {}
+    for offset in range(0, len(keys), batch_size):
+        batch = keys[offset : offset + batch_size]
+        declarations: List[str] = []
+        selections: List[str] = []
+        variables: Dict[str, Any] = {}
+        for i, (vault_address, chain_id, start_ts, end_ts) in enumerate(batch):
+            declarations.append(
+                f"$a{i}: String!, $c{i}: Int!, $o{i}: TimeseriesOptions"
+            )
+            selections.append(
+                f"""
+              v{i}: vaultByAddress(address: $a{i}, chainId: $c{i}) {{
+                historicalState {{
+                  sharePriceUsd(options: $o{i}) {{ x y }}
+                  totalAssetsUsd(options: $o{i}) {{ x y }}
+                }}
+              }}"""
+            )
+            variables[f"a{i}"] = vault_address
+            variables[f"c{i}"] = chain_id
+            variables[f"o{i}"] = _timeseries_options(start_ts, end_ts, None)
+        query = (
+            f"query VaultHistories({', '.join(declarations)}) {{"
+            f"{''.join(selections)}\n}}"
+        )
+
+        data = run_graphql_query(query, variables, allow_partial=True)
+        for i, key in enumerate(batch):
+            vault_data = data.get(f"v{i}")
+            if vault_data is not None:
+                histories[key] = _merge_vault_history(vault_data)
+    return histories
+
+
 def pick_start_end_points(
     series: List[Tuple[int, float]],
     start_ts: int,
@@ -212,33 +518,23 @@ def pick_start_end_points(
       - the first point with timestamp >= start_ts (or earliest if none),
       - the last point with timestamp <= end_ts (or latest if none).
 
+    ``series`` must be sorted by ascending timestamp, as returned by
+    fetch_share_price_usd_series; it is not re-sorted here.
+
     Returns (start_point, end_point), each a (timestamp, value) tuple.
     """
     if not series:
         raise ValueError("Empty time series, cannot pick start/end points.")
 
-    # Ensure sorted
-    series = sorted(series, key=lambda p: p[0])
-
-    # Pick start
-    start_point = None
-    for ts, val in series:
-        if ts >= start_ts:
-            start_point = (ts, val)
-            break
-    if start_point is None:
-        # If no point >= start_ts, use earliest
-        start_point = series[0]
-
-    # Pick end
-    end_point = None
-    for ts, val in reversed(series):
-        if ts <= end_ts:
-            end_point = (ts, val)
-            break
-    if end_point is None:
-        # If no point <= end_ts, use latest
-        end_point = series[-1]
+    timestamps = [p[0] for p in series]
+
+    # First point >= start_ts, or the earliest if none.
+    i = bisect_left(timestamps, start_ts)
+    start_point = series[i] if i < len(series) else series[0]
+
+    # Last point <= end_ts, or the latest if none.
+    j = bisect_right(timestamps, end_ts) - 1
+    end_point = series[j] if j >= 0 else series[-1]
 
     if start_point[0] > end_point[0]:
         raise ValueError("Inconsistent series: start point is after end point.")
@@ -260,15 +556,88 @@ def compute_pnl_from_prices(
     return (end_price / start_price) - 1.0
 
 
+def compute_pnl_from_prices_batch(
+    start_prices: Sequence[float],
+    end_prices: Sequence[float],
+) -> List[float]:
+    """
+    compute_pnl_from_prices over paired start/end prices, in input order.
+    Start prices must be positive: callers filter out the other vaults first
+    (see compute_curator_pnl).
+    """
+    if len(start_prices) != len(end_prices):
+        raise ValueError("start_prices and end_prices must have the same length.")
+    return [end / start - 1.0 for start, end in zip(start_prices, end_prices)]
+
+
+def _timestamp_with_utc_date(ts: int) -> str:
+    # UTC like the API timestamps, whatever the local timezone of the host.
+    return f"{ts}, {time.strftime('%Y-%m-%d', time.gmtime(ts))}"
+
+
+def _fetch_edge_points(
+    vault_address: str,
+    chain_id: int,
+    start_ts: int,
+    end_ts: int,
+    interval: Optional[str],
+) -> Optional[Tuple[Tuple[int, float], Tuple[int, float]]]:
+    """
+    Same endpoints as pick_start_end_points over the full [start_ts, end_ts]
+    series, fetched from two EDGE_WINDOW-long windows at each end of it.
+    Returns None when either window has no point.
+    """
+    if end_ts - start_ts <= EDGE_WINDOW:
+        # Both windows would be the whole range: one query is enough.
+        series = fetch_share_price_usd_series(
+            vault_address, chain_id, start_ts, end_ts, interval, disk_cache=True
+        )
+        if not series:
+            return None
+        return series[0], series[-1]
+
+    start_future = _FETCH_POOL.submit(
+        fetch_share_price_usd_series,
+        vault_address,
+        chain_id,
+        start_ts,
+        min(start_ts + EDGE_WINDOW, end_ts),
+        interval,
+        disk_cache=True,
+    )
+    end_future = _FETCH_POOL.submit(
+        fetch_share_price_usd_series,
+        vault_address,
+        chain_id,
+        max(end_ts - EDGE_WINDOW, start_ts),
+        end_ts,
+        interval,
+        disk_cache=True,
+    )
+    start_series = start_future.result()
+    end_series = end_future.result()
+    if not start_series or not end_series:
+        return None
+    start_point, end_point = start_series[0], end_series[-1]
+    if start_point[0] > end_point[0]:
+        return None
+    return start_point, end_point
+
+
 def compute_vault_pnl_between_dates(
     vault_address: str,
     chain_id: int,
     start_date_str: str,
     end_date_str: str,
+    interval: Optional[str] = "DAY",
+    full_series: bool = False,
 ) -> Dict[str, Any]:
     """
       1. Convert date strings to timestamps.
-      2. Fetch sharePriceUsd time series for the vault.
+      2. Fetch sharePriceUsd points for the vault (daily points by default:
+         dates have day granularity, so finer points are unused). Only the
+         first and last day of the window are requested, concurrently,
+         unless ``full_series`` is set or either day has no point.
       3. Pick start/end points.
       4. Compute P&L between the two dates.
 
@@ -289,89 +658,206 @@ def compute_vault_pnl_between_dates(
     if end_ts <= start_ts:
         raise ValueError("end_date must be strictly after start_date.")
 
-    series = fetch_share_price_usd_series(
-        vault_address=vault_address,
-        chain_id=chain_id,
-        start_ts=start_ts,
-        end_ts=end_ts,
-    )
-
-    (ts_start, price_start), (ts_end, price_end) = pick_start_end_points(
-        series,
-        start_ts=start_ts,
-        end_ts=end_ts,
-    )
+    endpoints = None
+    if not full_series:
+        endpoints = _fetch_edge_points(
+            vault_address, chain_id, start_ts, end_ts, interval
+        )
+    if endpoints is None:
+        series = fetch_share_price_usd_series(
+            vault_address=vault_address,
+            chain_id=chain_id,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            interval=interval,
+            disk_cache=True,
+        )
+        endpoints = pick_start_end_points(
+            series,
+            start_ts=start_ts,
+            end_ts=end_ts,
+        )
+    (ts_start, price_start), (ts_end, price_end) = endpoints
 
     pnl_decimal = compute_pnl_from_prices(price_start, price_end)
 
     return {
         "vault_address": vault_address,
         "chain_id": chain_id,
-        "start_timestamp": f"{ts_start}, {datetime.fromtimestamp(ts_start):%Y-%m-%d}",
-        "end_timestamp": f"{ts_end}, {datetime.fromtimestamp(ts_end):%Y-%m-%d}",
+        "start_timestamp": _timestamp_with_utc_date(ts_start),
+        "end_timestamp": _timestamp_with_utc_date(ts_end),
         "start_price_usd": price_start,
         "end_price_usd": price_end,
         "pnl_decimal": pnl_decimal,
     }
 
 
+def compute_curator_pnl(
+    curator_id: str,
+    start_date_str: str,
+    end_date_str: str,
+    interval: Optional[str] = "DAY",
+) -> List[Dict[str, Any]]:
+    """
+    compute_vault_pnl_between_dates for every vault of a curator: the series
+    are fetched concurrently and the PnLs computed in one batch.
+
+    Returns one dict per vault (same keys as compute_vault_pnl_between_dates,
+    plus "name"), in the order of fetch_vaults_for_curator. A vault whose
+    series cannot be fetched (missing data, GraphQL or HTTP error) or starts
+    at a non-positive price is left out.
+    """
+    start_ts = iso_date_to_unix_timestamp(start_date_str)
+    end_ts = iso_date_to_unix_timestamp(end_date_str)
+
+    if end_ts <= start_ts:
+        raise ValueError("end_date must be strictly after start_date.")
+
+    vaults = [
+        item
+        for item in fetch_vaults_for_curator(curator_id)
+        if item.get("address") and (item.get("chain") or {}).get("id") is not None
+    ]
+
+    def fetch_endpoints(
+        item: Dict[str, Any],
+    ) -> Optional[Tuple[Tuple[int, float], Tuple[int, float]]]:
+        try:
+            series = fetch_share_price_usd_series(
+                vault_address=item["address"],
+                chain_id=item["chain"]["id"],
+                start_ts=start_ts,
+                end_ts=end_ts,
+                interval=interval,
+                disk_cache=True,
+            )
+            start_point, end_point = pick_start_end_points(
+                series, start_ts=start_ts, end_ts=end_ts
+            )
+        except (ValueError, RuntimeError, requests.RequestException):
+            # Missing data, GraphQL or HTTP error: skip this vault only.
+            return None
+        if start_point[1] <= 0:
+            return None
+        return start_point, end_point
+
+    rows = [
+        (item, endpoints)
+        for item, endpoints in zip(vaults, _FETCH_POOL.map(fetch_endpoints, vaults))
+        if endpoints is not None
+    ]
+    pnls = compute_pnl_from_prices_batch(
+        [start[1] for _, (start, _) in rows],
+        [end[1] for _, (_, end) in rows],
+    )
+
+    results: List[Dict[str, Any]] = []
+    for (item, (start_point, end_point)), pnl_decimal in zip(rows, pnls):
+        results.append(
+            {
+                "vault_address": item["address"],
+                "chain_id": item["chain"]["id"],
+                "name": item.get("name"),
+                "start_timestamp": _timestamp_with_utc_date(start_point[0]),
+                "end_timestamp": _timestamp_with_utc_date(end_point[0]),
+                "start_price_usd": start_point[1],
+                "end_price_usd": end_point[1],
+                "pnl_decimal": pnl_decimal,
+            }
+        )
+    return results
+
+
 def get_network_by_id(id):
-    for n in networks:
-        if n.get("id") == id:
-            return n.get("network")
-    return None
+    return _NETWORK_BY_ID.get(id)
+
+
+def get_network_id(network: str) -> Optional[int]:
+    return _ID_BY_NETWORK.get(network)
+
+
+_HEX_DIGITS_DELETE = str.maketrans("", "", "0123456789abcdef")
 
 
 def looks_like_address(value: str) -> bool:
-    if not value:
+    if not value or len(value) != 42:
         return False
     value = value.lower()
-    return (
-        value.startswith("0x")
-        and len(value) == 42
-        and all(c in "0123456789abcdef" for c in value[2:])
-    )
+    # Deleting every hex digit must leave nothing behind.
+    return value.startswith("0x") and not value[2:].translate(_HEX_DIGITS_DELETE)
+
+
+_CURATOR_BY_ID_QUERY = """
+query CuratorById($curatorId: String!) {
+  curator(id: $curatorId) {
+    id
+    name
+    description
+    verified
+    addresses {
+      chainId
+      address
+    }
+  }
+}
+"""
 
 
 def fetch_curator_by_id(curator_id: str) -> Optional[Dict[str, Any]]:
-    query = """
-    query CuratorById($curatorId: String!) {
-      curator(id: $curatorId) {
-        id
-        name
-        description
-        verified
-        addresses {
-          chainId
-          address
-        }
+    data = run_graphql_query(_CURATOR_BY_ID_QUERY, {"curatorId": curator_id})
+    return data.get("curator")
+
+
+_CURATOR_BY_ADDRESS_QUERY = """
+query CuratorByAddress($address: String!) {
+  curators(where: { address_in: [$address] }, first: 1) {
+    items {
+      id
+      name
+      description
+      verified
+      addresses {
+        chainId
+        address
       }
     }
-    """
-    data = run_graphql_query(query, {"curatorId": curator_id})
-    return data.get("curator")
+  }
+}
+"""
 
 
 def fetch_curator_by_address(address: str) -> Optional[Dict[str, Any]]:
-    query = """
-    query CuratorByAddress($address: String!) {
-      curators(where: { address_in: [$address] }, first: 1) {
-        items {
-          id
-          name
-          description
-          verified
-          addresses {
-            chainId
-            address
-          }
-        }
+    data = run_graphql_query(_CURATOR_BY_ADDRESS_QUERY, {"address": address})
+    items = (data.get("curators") or {}).get("items") or []
+    return items[0] if items else None
+
+
+_CURATOR_PROFILE_QUERY = """
+query CuratorProfile($curatorId: String!, $address: String!) {
+  byId: curator(id: $curatorId) {
+    id
+    name
+    description
+    verified
+    addresses {
+      chainId
+      address
+    }
+  }
+  byAddress: curators(where: { address_in: [$address] }, first: 1) {
+    items {
+      id
+      name
+      description
+      verified
+      addresses {
+        chainId
+        address
       }
     }
-    """
-    data = run_graphql_query(query, {"address": address})
-    items = data.get("curators", {}).get("items") or []
-    return items[0] if items else None
+  }
+}
+"""
 
 
 def fetch_curator_profile(curator_query: str) -> Optional[Dict[str, Any]]:
@@ -384,14 +870,50 @@ def fetch_curator_profile(curator_query: str) -> Optional[Dict[str, Any]]:
 
     normalized = curator_query.strip()
 
-    curator = None
-    if not looks_like_address(normalized):
-        curator = fetch_curator_by_id(normalized)
+    if looks_like_address(normalized):
+        return fetch_curator_by_address(normalized)
 
-    if curator is None:
-        curator = fetch_curator_by_address(normalized)
+    # Both lookups in one round trip; the slug/id match wins. A slug is
+    # rarely a valid address (and an unknown slug may be reported as an
+    # error), so one failing alias must not hide the other's answer.
+    data = run_graphql_query(
+        _CURATOR_PROFILE_QUERY,
+        {"curatorId": normalized, "address": normalized},
+        allow_partial=True,
+    )
+    curator = data.get("byId")
+    if curator is not None:
+        return curator
+
+    by_address = data.get("byAddress")
+    if by_address is None:
+        # A list field is only null when its lookup errored.
+        raise RuntimeError(f"Curator lookup failed for {normalized!r}")
+    items = by_address.get("items") or []
+    return items[0] if items else None
 
-    return curator
+
+_CURATOR_VAULTS_QUERY = """
+query CuratorVaults($curatorId: String!, $first: Int!) {
+  vaults(first: $first, where: { curator_in: [$curatorId] }) {
+    items {
+      id
+      name
+      address
+      whitelisted
+      chain {
+        id
+      }
+      asset {
+        symbol
+      }
+      state {
+        totalAssetsUsd
+      }
+    }
+  }
+}
+"""
 
 
 def fetch_vaults_for_curator(
@@ -401,105 +923,101 @@ def fetch_vaults_for_curator(
     if not curator_id:
         return []
 
-    query = """
-    query CuratorVaults($curatorId: String!, $first: Int!) {
-      vaults(first: $first, where: { curator_in: [$curatorId] }) {
-        items {
-          id
-          name
-          address
-          whitelisted
-          chain {
-            id
+    data = run_graphql_query(
+        _CURATOR_VAULTS_QUERY, {"curatorId": curator_id, "first": limit}
+    )
+    return (data.get("vaults") or {}).get("items") or []
+
+
+_VAULT_EXTENDED_QUERY = """
+query VaultExtended($address: String!, $chainId: Int!) {
+  vaultByAddress(address: $address, chainId: $chainId) {
+    address
+    name
+    symbol
+    whitelisted
+    promoted
+    metadata {
+      description
+    }
+    asset {
+      symbol
+      name
+    }
+    liquidity {
+      usd
+    }
+    state {
+      totalAssetsUsd
+      apy
+      netApy
+      fee
+      sharePriceUsd
+      curator
+      guardian
+      owner
+      timestamp
+      allocation {
+        supplyAssetsUsd
+        enabled
+        market {
+          uniqueKey
+          loanAsset {
+            symbol
           }
-          asset {
+          collateralAsset {
             symbol
           }
+          oracle {
+            type
+          }
+          lltv
           state {
-            totalAssetsUsd
+            utilization
+            liquidityAssetsUsd
           }
         }
       }
     }
-    """
-
-    data = run_graphql_query(query, {"curatorId": curator_id, "first": limit})
-    return data.get("vaults", {}).get("items") or []
+  }
+}
+"""
 
 
 def fetch_vault_details(
     vault_address: str,
     chain_id: int,
 ) -> Optional[Dict[str, Any]]:
-    query = """
-    query VaultExtended($address: String!, $chainId: Int!) {
-      vaultByAddress(address: $address, chainId: $chainId) {
-        address
-        name
-        symbol
-        whitelisted
-        promoted
-        metadata {
-          description
-          image
-        }
-        asset {
-          symbol
-          name
-          decimals
-        }
-        liquidity {
-          usd
-          underlying
-        }
-        chain {
-          id
-        }
-        state {
-          totalAssetsUsd
-          totalAssets
-          totalSupply
-          apy
-          netApy
-          netApyWithoutRewards
-          fee
-          sharePriceUsd
-          curator
-          feeRecipient
-          guardian
-          owner
-          timestamp
-          allocation {
-            supplyAssetsUsd
-            supplyCapUsd
-            enabled
-            market {
-              uniqueKey
-              loanAsset {
-                symbol
-              }
-              collateralAsset {
-                symbol
-              }
-              oracle {
-                type
-              }
-              lltv
-              state {
-                utilization
-                liquidityAssetsUsd
-              }
-            }
-          }
-        }
-      }
-    }
-    """
     variables = {"address": vault_address, "chainId": chain_id}
-    data = run_graphql_query(query, variables)
+    data = run_graphql_query(_VAULT_EXTENDED_QUERY, variables)
     return data.get("vaultByAddress")
 
 
+def fetch_vault_details_many(
+    pairs: List[Tuple[str, int]],
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    fetch_vault_details for each (vault_address, chain_id) pair, issued
+    concurrently. Results are in input order; the first error is re-raised.
+    """
+    if not pairs:
+        return []
+    return list(_FETCH_POOL.map(fetch_vault_details, *zip(*pairs)))
+
+
+def fetch_share_price_usd_series_many(
+    keys: List[Tuple[str, int, Optional[int], Optional[int]]],
+) -> List[List[Tuple[int, float]]]:
+    """
+    fetch_share_price_usd_series for each (vault_address, chain_id, start_ts,
+    end_ts) key, issued concurrently. Results are in input order; the first
+    error is re-raised.
+    """
+    if not keys:
+        return []
+    return list(_FETCH_POOL.map(fetch_share_price_usd_series, *zip(*keys)))
+
+
 if __name__ == "__main__":
     example_vault_address = "0xd63070114470f685b75B74D60EEc7c1113d33a3D"
     example_chain_id = 1